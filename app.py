@@ -1,6 +1,8 @@
 import streamlit as st
 import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
 import app_module as AM
+import numpy as np
 import plotly.graph_objects as go
 from plotly.validators.scatter.marker import SymbolValidator
 
@@ -244,3 +246,70 @@ st.plotly_chart(fig4)
 st.divider()
 st.plotly_chart(fig5)
 st.divider()
+
+
+st.markdown(f"### Interaction Diagrams: Buckling State Limit UC over Stress Planes")
+st.markdown(f"* Critical buckling stresses of the current panel are kept, i.e. the edge stress ratios kappa_x and kappa_y are held while the stresses vary.")
+st.markdown(f"* The stress not shown on the plane keeps its value from the inputs. The white line is the allowable envelope UC = 1.")
+
+plane = st.selectbox("Select stress plane:", ["sigma_x_max v/s sigma_y_max", "sigma_x_max v/s tau"])
+grid_size = st.slider("Select grid resolution (points per axis):", min_value=50, max_value=500, value=500, step=50)
+
+sigma_x_limit = my_panel.eta() * my_panel.sigma_C_x()
+sigma_x_grid = np.linspace(0, 1.25 * sigma_x_limit, grid_size)
+if plane == "sigma_x_max v/s sigma_y_max":
+    y_name = "sigma_y_max"
+    y_grid = np.linspace(0, 1.25 * my_panel.eta() * my_panel.sigma_C_y(), grid_size)
+    y_current = my_panel.sigma_y_max()
+    UC_grid = ABSB.evaluate_UC_grid(my_panel, sigma_x_max=sigma_x_grid[np.newaxis, :], sigma_y_max=y_grid[:, np.newaxis])
+else:
+    y_name = "tau"
+    y_grid = np.linspace(0, 1.25 * my_panel.eta() * my_panel.tau_C(), grid_size)
+    y_current = my_panel.tau
+    UC_grid = ABSB.evaluate_UC_grid(my_panel, sigma_x_max=sigma_x_grid[np.newaxis, :], tau=y_grid[:, np.newaxis])
+
+fig6 = go.Figure()
+fig6.add_trace(
+    go.Heatmap(
+        x=sigma_x_grid,
+        y=y_grid,
+        z=UC_grid,
+        zmin=0,
+        zmax=2,
+        colorscale="RdYlGn_r",
+        colorbar=dict(title="UC")
+    )
+)
+fig6.add_trace(
+    go.Contour(
+        x=sigma_x_grid,
+        y=y_grid,
+        z=UC_grid,
+        contours=dict(start=1, end=1, size=1, coloring="none", showlabels=True),
+        line=dict(color="white", width=3),
+        showscale=False,
+        name="UC = 1"
+    )
+)
+fig6.add_trace(
+    go.Scatter(
+        mode="markers",
+        x=[my_panel.sigma_x_max()],
+        y=[y_current],
+        name="Current stress state",
+        marker_symbol="asterisk",
+        marker=dict(
+            color='Purple',
+            size=10,
+            line=dict(
+                color='Purple',
+                width=1)
+            )
+        )
+)
+fig6.layout.title.text = f"Buckling State Limit UC: sigma_x_max v/s {y_name}"
+fig6.layout.xaxis.title = "sigma_x_max (N/cm2)"
+fig6.layout.yaxis.title = f"{y_name} (N/cm2)"
+
+st.plotly_chart(fig6)
+st.divider()
@@ -1,12 +1,24 @@
 import calculations.ABS_Plate_Buckling as ABS
-from handcalcs.decorator import handcalc
+from functools import wraps
 
-hc_renderer = handcalc(override='long')
 
-calc_alpha = hc_renderer(ABS.calc_alpha)
-calc_max_stress = hc_renderer(ABS.calc_sigma_max)
-calc_min_stress = hc_renderer(ABS.calc_sigma_min)
-calc_tau_0 = hc_renderer(ABS.calc_tau_0)
+def lazy_handcalc(func):
+    """wraps a calc function with handcalcs on its first call, so importing this module does not import handcalcs"""
+    rendered = []
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not rendered:
+            from handcalcs.decorator import handcalc
+            rendered.append(handcalc(override='long')(func))
+        return rendered[0](*args, **kwargs)
+    return wrapper
+
+
+calc_alpha = lazy_handcalc(ABS.calc_alpha)
+calc_max_stress = lazy_handcalc(ABS.calc_sigma_max)
+calc_min_stress = lazy_handcalc(ABS.calc_sigma_min)
+calc_tau_0 = lazy_handcalc(ABS.calc_tau_0)
 
 
 def calc(  
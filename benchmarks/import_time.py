@@ -0,0 +1,65 @@
+"""Import-time benchmark for the core and report paths.
+
+Runs each import in a fresh interpreter under ``python -X importtime`` and prints the cumulative
+import time of the module together with the heavy third-party packages it pulled in.
+
+    python benchmarks/import_time.py [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import_paths = {
+    "interpreter only": "pass",
+    "core": "import calculations.ABS_Plate_Buckling",
+    "bulk": "import calculations.ABS_Plate_Buckling_Bulk",
+    "report (lazy)": "import app_module",
+    "report (rendered)": "import app_module; app_module.calc_tau_0(23500)",
+}
+heavy_packages = ("numpy", "handcalcs", "pyarrow", "streamlit", "plotly")
+
+
+def measure(statement: str) -> tuple:
+    """runs one import statement under -X importtime
+
+    Returns:
+        tuple: (total cumulative import time in microseconds, heavy packages imported)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    loaded = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "): # top level imports only, nested ones are included in their parent
+            total_us += int(cumulative)
+        package = name.strip().split(".")[0]
+        if package in heavy_packages:
+            loaded.add(package)
+    return total_us, sorted(loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per path, the fastest is reported")
+    args = parser.parse_args()
+
+    print(f"{'path':<20}{'import time (ms)':>18}  heavy packages")
+    for label, statement in import_paths.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        total_us = min(run[0] for run in runs)
+        print(f"{label:<20}{total_us / 1000:>18.1f}  {', '.join(runs[0][1]) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import numpy as np
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+
+manifest_name = "manifest.json"
+
+
+def _chunk_path(checkpoint_dir: str, chunk: int) -> str:
+    return os.path.join(checkpoint_dir, f"chunk_{chunk:08d}.npz")
+
+
+def _atomic_write(path: str, write) -> None:
+    """writes a file through a temporary sibling and renames it into place, so a crash never leaves a partial file"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def fingerprint_columns(columns: dict) -> str:
+    """calculates a digest of the input columns, used to refuse resuming a checkpoint against different inputs
+
+    Args:
+        columns (dict): panel input columns, keyed by the names in "panel_input_columns"
+
+    String columns are hashed as fixed width unicode, whether they arrive as str or object
+    arrays, since the bytes of an object array are pointers that change between processes.
+
+    Returns:
+        str: hex digest of the column names, dtypes and values
+    """
+    digest = hashlib.sha256()
+    for name in sorted(columns):
+        values = np.asarray(columns[name])
+        if values.dtype.kind in "OSU":
+            values = values.astype(str)
+        values = np.ascontiguousarray(values)
+        digest.update(name.encode())
+        digest.update(str(values.dtype).encode())
+        digest.update(str(values.shape).encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def evaluate_panels_checkpointed(columns: dict, checkpoint_dir: str, chunk_size: int = 100_000, keep_checkpoint: bool = False, dtype = np.float64) -> dict:
+    """evaluates "evaluate_panels" chunk by chunk, checkpointing every completed chunk to disk
+
+    Each completed chunk is written atomically as its own file in "checkpoint_dir", next to a
+    manifest recording the row count, chunk size and input fingerprint. Calling again with the
+    same inputs and directory after an interruption only evaluates the chunks that are missing.
+    Every row is computed independently, so the resumed output is bit-identical to an
+    uninterrupted run.
+
+    Args:
+        columns (dict): panel input columns (arrays with one entry per panel, or scalars), keyed by the names in "panel_input_columns"
+        checkpoint_dir (str): directory holding the manifest and chunk files, created if missing
+        chunk_size (int, optional): number of rows per chunk and checkpoint. Defaults to 100_000.
+        keep_checkpoint (bool, optional): keep the checkpoint files after a successful run. Defaults to False.
+        dtype (optional): precision of the evaluation and of the stored results. Defaults to np.float64.
+
+    Returns:
+        dict: one array of "dtype" per name in "panel_result_columns"
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    unknown = set(columns) - set(ABSB.panel_input_columns)
+    if unknown:
+        raise ValueError(f"Unknown input columns {sorted(unknown)}. Acceptable columns are: {ABSB.panel_input_columns}")
+    columns = {name: np.asarray(values) for name, values in columns.items()}
+
+    n_rows = max((np.size(v) for v in columns.values() if np.ndim(v) > 0), default=1)
+    manifest = dict(n_rows=n_rows, chunk_size=chunk_size, dtype=np.dtype(dtype).name, fingerprint=fingerprint_columns(columns))
+    manifest_path = os.path.join(checkpoint_dir, manifest_name)
+
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            saved = json.load(f)
+        if saved != manifest:
+            raise ValueError(f"Checkpoint in {checkpoint_dir} was written for different inputs, chunk size or dtype")
+    else:
+        _atomic_write(manifest_path, lambda f: f.write(json.dumps(manifest).encode()))
+
+    results = {name: np.empty(n_rows, dtype=dtype) for name in ABSB.panel_result_columns}
+    n_chunks = -(-n_rows // chunk_size)
+    for chunk in range(n_chunks):
+        rows = slice(chunk * chunk_size, min((chunk + 1) * chunk_size, n_rows))
+        path = _chunk_path(checkpoint_dir, chunk)
+        if os.path.exists(path):
+            with np.load(path) as saved_chunk:
+                for name in ABSB.panel_result_columns:
+                    results[name][rows] = saved_chunk[name]
+            continue
+        chunk_columns = ABSB.select_rows(columns, rows)
+        chunk_results = ABSB.evaluate_panels(**chunk_columns, dtype=dtype)
+        for name in ABSB.panel_result_columns:
+            results[name][rows] = chunk_results[name]
+        _atomic_write(path, lambda f: np.savez(f, **chunk_results))
+
+    if not keep_checkpoint:
+        for chunk in range(n_chunks):
+            os.remove(_chunk_path(checkpoint_dir, chunk))
+        os.remove(manifest_path)
+    return results
@@ -0,0 +1,246 @@
+import numpy as np
+import calculations.ABS_Plate_Buckling as ABS
+
+panel_input_columns = ("load_case_type","stiffener_type","s","l","t","sigma_ax","sigma_ay","sigma_bx","sigma_by","tau","sigma_0","E","nu")
+panel_result_columns = ("alpha","sigma_x_max","sigma_y_max","kappa_x","kappa_y","k_s_tau","k_s_sigma_x","k_s_sigma_y","tau_E","sigma_E_x","sigma_E_y","tau_C","sigma_C_x","sigma_C_y","UC_buckling_state_limit")
+
+
+def select_rows(columns: dict, rows) -> dict:
+    """selects rows of panel input columns, passing scalar (shared) columns through unchanged
+
+    Args:
+        columns (dict): panel input columns, arrays with one entry per panel or scalars
+        rows (slice or array_like): rows to select
+
+    Returns:
+        dict: the selected panel input columns
+    """
+    return {name: (np.asarray(v)[rows] if np.ndim(v) > 0 else v) for name, v in columns.items()}
+
+
+def calc_C1(stiffener_type) -> np.ndarray:
+    """calculates value of C1 for an array of stiffener types
+
+    Args:
+        stiffener_type (array_like of str): items from the list "valid_stiffener_types"
+
+    Returns:
+        np.ndarray: values of C1
+    """
+    stiffener_type = np.asarray(stiffener_type)
+    if not np.isin(stiffener_type, ABS.valid_stiffener_types).all():
+        raise ValueError(f"Invalid stiffener type provided. Acceptable stiffener types are: {ABS.valid_stiffener_types}")
+    return np.where(np.isin(stiffener_type, ("ANGLE", "TEE")), 1.1, 1.0)
+
+
+def calc_C2(stiffener_type) -> np.ndarray:
+    """calculates value of C2 for an array of stiffener types
+
+    Args:
+        stiffener_type (array_like of str): items from the list "valid_stiffener_types"
+
+    Returns:
+        np.ndarray: values of C2
+    """
+    stiffener_type = np.asarray(stiffener_type)
+    if not np.isin(stiffener_type, ABS.valid_stiffener_types).all():
+        raise ValueError(f"Invalid stiffener type provided. Acceptable stiffener types are: {ABS.valid_stiffener_types}")
+    return np.select(
+        [np.isin(stiffener_type, ("ANGLE", "TEE")), np.isin(stiffener_type, ("FLAT BAR", "BULB PLATE"))],
+        [1.2, 1.1],
+        default=1.0
+    )
+
+
+def calc_eta(load_case_type) -> np.ndarray:
+    """calculates maximum allowable strength factor for an array of load case types
+
+    Args:
+        load_case_type (array_like of str): items from the list "valid_load_case_types"
+
+    Returns:
+        np.ndarray: maximum allowable strength factors, eta
+    """
+    phi = 1.0 # Adjustment factor ABS Buckling Requirements (WSD), Cl 3-1.7
+    load_case_type = np.asarray(load_case_type)
+    if not np.isin(load_case_type, ABS.valid_load_case_types).all():
+        raise ValueError(f"Invalid load case type provided. Acceptable load case types are: {ABS.valid_load_case_types}")
+    return np.where(load_case_type == "NORMAL OPERATION", 0.6 * phi, 0.8 * phi)
+
+
+def calc_kappa(sigma_min, sigma_max) -> np.ndarray:
+    """calculates ratio of edge stresses, NaN where sigma_max is zero
+
+    Args:
+        sigma_min (np.ndarray): minimum stress (Axial Stress - Bending Stress), N/cm2
+        sigma_max (np.ndarray): maximum stress (Axial Stress + Bending Stress), N/cm2
+
+    Returns:
+        np.ndarray: ratio of edge stresses, kappa
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa = np.divide(sigma_min, sigma_max)
+    return np.where(sigma_max == 0, np.nan, kappa)
+
+
+def calc_k_s_sigma_x(C1, kappa_x) -> np.ndarray:
+    """calculates boundary dependant factor for stress sigma_x (normal to shorter side)
+
+    Args:
+        C1 (np.ndarray): values of C1 based on Stiffener type
+        kappa_x (np.ndarray): ratio of edge stresses normal to shorter side
+
+    Returns:
+        np.ndarray: boundary dependant factor, NaN where kappa_x is outside [-1, 1]
+    """
+    return np.select(
+        [(0 <= kappa_x) & (kappa_x <= 1.0), (-1.0 <= kappa_x) & (kappa_x < 0.0)],
+        [C1 * (8.4/(kappa_x + 1.1)), C1 * (7.6 - (6.4 * kappa_x) + 10*(kappa_x**2))],
+        default=np.nan
+    )
+
+
+def calc_k_s_sigma_y(C2, alpha, kappa_y) -> np.ndarray:
+    """calculates boundary dependant factor for stress sigma_y (normal to longer side)
+
+    Args:
+        C2 (np.ndarray): values of C2 based on Stiffener type
+        alpha (np.ndarray): aspect ratio of the plate panel
+        kappa_y (np.ndarray): ratio of edge stresses normal to longer side
+
+    Returns:
+        np.ndarray: boundary dependant factor, NaN where the scalar formula is undefined (alpha < 1 with kappa_y < 1/3)
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_short = C2 * (1.0875 * (1 + (1/(alpha**2)))**2 - (18/(alpha**2))) * (1 + kappa_y) + (24/(alpha**2))
+        k_long = C2 * (1.0875 * (1 + (1/(alpha**2)))**2 - (9/(alpha**2))) * (1 + kappa_y) + (12/(alpha**2))
+        k_high_kappa = C2 * (1 + (1/(alpha**2)))**2 * (1.675 - (0.675*kappa_y))
+    low_kappa = kappa_y < (1/3)
+    return np.select(
+        [low_kappa & (1.0 <= alpha) & (alpha <= 2.0), low_kappa & (alpha > 2.0), kappa_y >= (1/3)],
+        [k_short, k_long, k_high_kappa],
+        default=np.nan
+    )
+
+
+def calc_stress_C(stress_0, stress_E, P_r: float = 0.6) -> np.ndarray:
+    """calculate critical buckling stresses
+
+    Args:
+        stress_0 (np.ndarray): yield or shear strength of plate, N/cm2
+        stress_E (np.ndarray): elastic buckling stress, N/cm2
+        P_r (float, optional): proportional linear elastic limit of the structure. Defaults to 0.6 for steel.
+
+    Returns:
+        np.ndarray: critical buckling stresses, N/cm2
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inelastic = stress_0 * (1 - P_r * (1 - P_r) * (stress_0 / stress_E))
+    return np.where(stress_E <= P_r * stress_0, stress_E, inelastic)
+
+
+def evaluate_panels(
+    load_case_type,
+    stiffener_type,
+    s,
+    l,
+    t,
+    sigma_ax,
+    sigma_ay,
+    sigma_bx,
+    sigma_by,
+    tau,
+    sigma_0 = 235000,
+    E = 2.06e7,
+    nu = 0.3,
+    dtype = np.float64
+) -> dict:
+    """evaluates the buckling chain of "Panel" for many panels at once
+
+    All arguments take the same meaning and units as the fields of "Panel" and may be
+    arrays (one entry per panel) or scalars (shared by all panels). "dtype" sets the
+    precision of every intermediate and result; np.float32 halves memory and bandwidth,
+    see "ABS_Plate_Buckling_Precision" for its error checks.
+
+    Returns:
+        dict: one array of "dtype" per name in "panel_result_columns"
+    """
+    s, l, t, sigma_ax, sigma_ay, sigma_bx, sigma_by, tau, sigma_0, E, nu = (
+        np.asarray(x, dtype=dtype) for x in (s, l, t, sigma_ax, sigma_ay, sigma_bx, sigma_by, tau, sigma_0, E, nu)
+    )
+    C1 = calc_C1(stiffener_type).astype(dtype)
+    C2 = calc_C2(stiffener_type).astype(dtype)
+    eta = calc_eta(load_case_type).astype(dtype)
+
+    alpha = ABS.calc_alpha(l, s)
+    sigma_x_max = ABS.calc_sigma_max(sigma_ax, sigma_bx)
+    sigma_y_max = ABS.calc_sigma_max(sigma_ay, sigma_by)
+    kappa_x = calc_kappa(ABS.calc_sigma_min(sigma_ax, sigma_bx), sigma_x_max)
+    kappa_y = calc_kappa(ABS.calc_sigma_min(sigma_ay, sigma_by), sigma_y_max)
+
+    k_s_tau = ABS.calc_k_s_tau(alpha, C1)
+    k_s_sigma_x = calc_k_s_sigma_x(C1, kappa_x)
+    k_s_sigma_y = calc_k_s_sigma_y(C2, alpha, kappa_y)
+
+    tau_E = ABS.calc_stress_E(k_s_tau, t, s, E, nu)
+    sigma_E_x = ABS.calc_stress_E(k_s_sigma_x, t, s, E, nu)
+    sigma_E_y = ABS.calc_stress_E(k_s_sigma_y, t, s, E, nu)
+
+    tau_C = calc_stress_C(ABS.calc_tau_0(sigma_0), tau_E)
+    sigma_C_x = calc_stress_C(sigma_0, sigma_E_x)
+    sigma_C_y = calc_stress_C(sigma_0, sigma_E_y)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        UC = ABS.calc_UC_buckling_state_limit(sigma_x_max, sigma_y_max, tau, sigma_C_x, sigma_C_y, tau_C, eta)
+
+    results = dict(
+        alpha=alpha,
+        sigma_x_max=sigma_x_max,
+        sigma_y_max=sigma_y_max,
+        kappa_x=kappa_x,
+        kappa_y=kappa_y,
+        k_s_tau=k_s_tau,
+        k_s_sigma_x=k_s_sigma_x,
+        k_s_sigma_y=k_s_sigma_y,
+        tau_E=tau_E,
+        sigma_E_x=sigma_E_x,
+        sigma_E_y=sigma_E_y,
+        tau_C=tau_C,
+        sigma_C_x=sigma_C_x,
+        sigma_C_y=sigma_C_y,
+        UC_buckling_state_limit=UC,
+    )
+    shape = np.broadcast_shapes(*(np.shape(v) for v in results.values()))
+    return {name: np.broadcast_to(results[name], shape).astype(dtype) for name in panel_result_columns}
+
+
+def evaluate_UC_grid(panel: ABS.Panel, sigma_x_max = None, sigma_y_max = None, tau = None) -> np.ndarray:
+    """evaluates the buckling state limit UC of one panel over a grid of stress states
+
+    The critical stresses and eta of "panel" are calculated once and reused for every point, i.e.
+    the edge stress ratios kappa_x and kappa_y of the panel are held while the stresses are scaled.
+    Stresses left as None take the value of the panel; the others are broadcast against each other,
+    e.g. the outputs of np.meshgrid.
+
+    Args:
+        panel (Panel): plate panel providing the geometry, material and critical stresses
+        sigma_x_max (array_like, optional): maximum compressive stresses normal to shorter side, N/cm2
+        sigma_y_max (array_like, optional): maximum compressive stresses normal to longer side, N/cm2
+        tau (array_like, optional): edge shear stresses, N/cm2
+
+    Returns:
+        np.ndarray: buckling state limit UC for every stress state of the grid
+    """
+    sigma_x_max = panel.sigma_x_max() if sigma_x_max is None else np.asarray(sigma_x_max, dtype=np.float64)
+    sigma_y_max = panel.sigma_y_max() if sigma_y_max is None else np.asarray(sigma_y_max, dtype=np.float64)
+    tau = panel.tau if tau is None else np.asarray(tau, dtype=np.float64)
+    UC = ABS.calc_UC_buckling_state_limit(
+        sigma_x_max,
+        sigma_y_max,
+        tau,
+        panel.sigma_C_x(),
+        panel.sigma_C_y(),
+        panel.tau_C(),
+        panel.eta()
+    )
+    return np.asarray(UC, dtype=np.float64)
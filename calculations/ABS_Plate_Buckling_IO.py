@@ -0,0 +1,127 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+
+optional_columns = ("sigma_0","E","nu") # "evaluate_panels" defaults apply when these are absent
+
+
+def _column_to_numpy(column) -> np.ndarray:
+    """converts an Arrow column to a NumPy array without creating per-row Python objects
+
+    Numeric columns without nulls are returned as zero-copy views, except table columns split into
+    several chunks, which are combined into one copy. String columns are dictionary encoded and
+    expanded from their (small) dictionary by integer indexing.
+    """
+    if isinstance(column, pa.ChunkedArray):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if column.null_count:
+        raise ValueError("Panel input columns must not contain nulls")
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        column = pc.dictionary_encode(column)
+    if pa.types.is_dictionary(column.type):
+        dictionary = np.array(column.dictionary.to_pylist(), dtype=str)
+        return dictionary[column.indices.to_numpy(zero_copy_only=False)]
+    return column.to_numpy(zero_copy_only=False)
+
+
+def required_file_columns(column_map: dict = None, available = None) -> list:
+    """lists the file columns needed to evaluate panels
+
+    Args:
+        column_map (dict, optional): panel input name to file column name, for files using other names
+        available (iterable, optional): column names present in the file; optional inputs missing from it are skipped
+
+    Returns:
+        list: file column names to read
+    """
+    column_map = column_map or {}
+    names = [column_map.get(name, name) for name in ABSB.panel_input_columns]
+    if available is None:
+        return names
+    available = set(available)
+    missing = [name for name, file_name in zip(ABSB.panel_input_columns, names) if file_name not in available and name not in optional_columns]
+    if missing:
+        raise ValueError(f"Missing panel input columns {missing}")
+    return [name for name in names if name in available]
+
+
+def table_to_panel_columns(table, column_map: dict = None) -> dict:
+    """maps the panel input columns of an Arrow table or record batch to NumPy arrays
+
+    Args:
+        table (pa.Table or pa.RecordBatch): table holding the panel input columns
+        column_map (dict, optional): panel input name to file column name, for files using other names
+
+    Returns:
+        dict: panel input columns, keyed by the names in "panel_input_columns"
+    """
+    column_map = column_map or {}
+    available = set(table.schema.names)
+    required_file_columns(column_map, available)
+    columns = {}
+    for name in ABSB.panel_input_columns:
+        file_name = column_map.get(name, name)
+        if file_name in available:
+            columns[name] = _column_to_numpy(table.column(file_name))
+    return columns
+
+
+def results_to_table(table, results: dict):
+    """appends result columns to an Arrow table or record batch
+
+    Args:
+        table (pa.Table or pa.RecordBatch): input table
+        results (dict): output of "evaluate_panels"
+
+    Returns:
+        pa.Table or pa.RecordBatch: input columns followed by the result columns
+    """
+    arrays = list(table.columns) + [pa.array(results[name]) for name in results]
+    names = list(table.schema.names) + list(results)
+    if isinstance(table, pa.RecordBatch):
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def evaluate_parquet(source: str, destination: str, column_map: dict = None, passthrough_columns = (), keep_inputs: bool = True, batch_size: int = 65_536, dtype = np.float64) -> int:
+    """evaluates every panel of a Parquet file and writes the results to another Parquet file
+
+    The file is processed batch by batch, so memory use is bounded by "batch_size" rather than
+    the file size. Only the panel input columns and "passthrough_columns" are read; the output
+    holds the passthrough columns, the panel input columns (if "keep_inputs") and the results.
+    A source without rows gives a destination with the output schema and no rows.
+
+    Args:
+        source (str): Parquet file with one panel per row
+        destination (str): Parquet file to write
+        column_map (dict, optional): panel input name to file column name, for files using other names
+        passthrough_columns (iterable, optional): other source columns copied to the output, e.g. element ids
+        keep_inputs (bool, optional): write the panel input columns next to the results. Defaults to True.
+        batch_size (int, optional): maximum number of rows per batch. Defaults to 65_536.
+        dtype (optional): precision of the evaluation and of the result columns. Defaults to np.float64.
+
+    Returns:
+        int: number of rows written
+    """
+    parquet_file = pq.ParquetFile(source)
+    source_schema = parquet_file.schema_arrow
+    needed = required_file_columns(column_map, source_schema.names)
+    passthrough_columns = [name for name in passthrough_columns if name not in needed]
+    missing = [name for name in passthrough_columns if name not in source_schema.names]
+    if missing:
+        raise ValueError(f"Missing passthrough columns {missing}")
+    out_columns = passthrough_columns + (needed if keep_inputs else [])
+
+    result_type = pa.from_numpy_dtype(np.dtype(dtype))
+    out_schema = pa.schema(
+        [source_schema.field(name) for name in out_columns] + [pa.field(name, result_type) for name in ABSB.panel_result_columns]
+    )
+    n_rows = 0
+    with pq.ParquetWriter(destination, out_schema) as writer:
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=passthrough_columns + needed):
+            results = ABSB.evaluate_panels(**table_to_panel_columns(batch, column_map), dtype=dtype)
+            writer.write_batch(results_to_table(batch.select(out_columns), results))
+            n_rows += batch.num_rows
+    return n_rows
@@ -0,0 +1,150 @@
+import numpy as np
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+
+
+def flag_float64_recompute(results: dict, sigma_0, uc_atol: float = 1e-3, boundary_rtol: float = 1e-4, P_r: float = 0.6, sigma_ax = None, sigma_bx = None) -> np.ndarray:
+    """flags rows of a reduced precision result whose UC check or formula branch could flip in float64
+
+    A row is flagged when its UC is within "uc_atol" of 1.0, when it sits within "boundary_rtol"
+    of a branch boundary of the chain (kappa_x = -1, 0 or 1, kappa_y = 1/3, alpha = 1 or 2,
+    stress_E = P_r * stress_0 for tau, sigma_x and sigma_y), or when any result is not finite.
+    kappa_x = -1 and 1 also bound the range where the chain is defined. When the input stresses
+    "sigma_ax" and "sigma_bx" are given, rows with sigma_bx = 0 or sigma_ax = 0, whose kappa_x is
+    exactly 1 or -1 in any precision, are not flagged for that edge.
+
+    Args:
+        results (dict): output of "evaluate_panels", typically with dtype=np.float32
+        sigma_0 (array_like): specified minimum yield point of plate, N/cm2
+        uc_atol (float, optional): half width of the band around UC = 1.0. Defaults to 1e-3.
+        boundary_rtol (float, optional): relative distance to a branch boundary. Defaults to 1e-4.
+        P_r (float, optional): proportional linear elastic limit of the structure. Defaults to 0.6 for steel.
+        sigma_ax (array_like, optional): axial stress normal to shorter side, N/cm2
+        sigma_bx (array_like, optional): bending stress normal to shorter side, N/cm2
+
+    Returns:
+        np.ndarray: boolean mask of rows to recompute in float64
+    """
+    def near(value, boundary):
+        value = value.astype(np.float64)
+        return np.abs(value - boundary) <= boundary_rtol * np.maximum(np.abs(boundary), 1.0)
+
+    sigma_0 = np.asarray(sigma_0, dtype=np.float64)
+    flags = np.abs(results["UC_buckling_state_limit"].astype(np.float64) - 1.0) <= uc_atol
+    kappa_x_edge = near(results["kappa_x"], -1.0) | near(results["kappa_x"], 1.0)
+    if sigma_ax is not None and sigma_bx is not None:
+        kappa_x_edge = kappa_x_edge & (np.asarray(sigma_ax) != 0) & (np.asarray(sigma_bx) != 0)
+    flags = flags | kappa_x_edge | near(results["kappa_x"], 0.0)
+    flags = flags | near(results["kappa_y"], 1/3)
+    flags = flags | near(results["alpha"], 1.0) | near(results["alpha"], 2.0)
+    flags = flags | near(results["tau_E"], P_r * ABS.calc_tau_0(sigma_0))
+    flags = flags | near(results["sigma_E_x"], P_r * sigma_0) | near(results["sigma_E_y"], P_r * sigma_0)
+    for name in ABSB.panel_result_columns:
+        flags = flags | ~np.isfinite(results[name])
+    return flags
+
+
+def round_UC_float32(UC, UC_limit: float = 1.0) -> np.ndarray:
+    """rounds float64 UCs to float32 without moving any of them across "UC_limit"
+
+    Plain rounding can store a failing UC such as 1.00000003 as 1.0, which then passes. Values above
+    the limit that would round onto or below it are stored as the next float32 above the limit instead.
+
+    Args:
+        UC (np.ndarray): float64 buckling state limit UCs
+        UC_limit (float, optional): UC limit whose pass/fail result must be kept. Defaults to 1.0.
+
+    Returns:
+        np.ndarray: float32 UCs
+    """
+    UC = np.asarray(UC, dtype=np.float64)
+    UC32 = UC.astype(np.float32)
+    limit32 = np.float32(UC_limit)
+    above = np.nextafter(limit32, np.float32(np.inf))
+    return np.where((UC > UC_limit) & (UC32 <= limit32), above, UC32)
+
+
+def evaluate_panels_mixed_precision(columns: dict, uc_atol: float = 1e-3, boundary_rtol: float = 1e-4) -> tuple:
+    """evaluates panels in float32, recomputing flagged rows in float64
+
+    Results are stored as float32. Rows flagged by "flag_float64_recompute" are evaluated again
+    in float64 before being stored, so their formula branches follow the float64 path, and their
+    UC is rounded with "round_UC_float32" so the stored UC passes the UC <= 1.0 check exactly
+    when the float64 UC does.
+
+    Args:
+        columns (dict): panel input columns, keyed by the names in "panel_input_columns"
+        uc_atol (float, optional): half width of the band around UC = 1.0. Defaults to 1e-3.
+        boundary_rtol (float, optional): relative distance to a branch boundary. Defaults to 1e-4.
+
+    Returns:
+        tuple: (dict of float32 arrays per name in "panel_result_columns", boolean mask of recomputed rows)
+    """
+    results = {name: np.atleast_1d(v) for name, v in ABSB.evaluate_panels(**columns, dtype=np.float32).items()}
+    recompute = flag_float64_recompute(
+        results,
+        columns.get("sigma_0", 235000),
+        uc_atol,
+        boundary_rtol,
+        sigma_ax=columns["sigma_ax"],
+        sigma_bx=columns["sigma_bx"]
+    )
+    if recompute.any():
+        rows = np.flatnonzero(recompute)
+        subset = ABSB.select_rows(columns, rows)
+        results64 = ABSB.evaluate_panels(**subset)
+        for name in ABSB.panel_result_columns:
+            results[name][rows] = results64[name]
+        results["UC_buckling_state_limit"][rows] = round_UC_float32(results64["UC_buckling_state_limit"])
+    return results, recompute
+
+
+def validate_reduced_precision(columns: dict, sample_size: int = 10_000, seed: int = 0, uc_atol: float = 1e-3, boundary_rtol: float = 1e-4) -> dict:
+    """compares the float32 bulk path against the float64 scalar "Panel" path
+
+    Up to "sample_size" rows are drawn at random and evaluated through "Panel"; rows the scalar
+    path cannot evaluate (e.g. kappa outside its valid range) are left out of the comparison.
+
+    Args:
+        columns (dict): panel input columns, keyed by the names in "panel_input_columns"
+        sample_size (int, optional): maximum number of rows checked against "Panel". Defaults to 10_000.
+        seed (int, optional): seed for drawing the sample. Defaults to 0.
+        uc_atol (float, optional): half width of the band around UC = 1.0. Defaults to 1e-3.
+        boundary_rtol (float, optional): relative distance to a branch boundary. Defaults to 1e-4.
+
+    Returns:
+        dict: max relative UC error of the raw float32 path and of the mixed precision path, the row
+              where the raw error peaks, the number of rows compared and the number of rows flagged
+              for float64 recomputation
+    """
+    columns = {name: np.asarray(v) for name, v in columns.items()}
+    n_rows = max((v.size for v in columns.values() if v.ndim > 0), default=1)
+    rows = np.arange(n_rows)
+    if n_rows > sample_size:
+        rows = np.sort(np.random.default_rng(seed).choice(n_rows, sample_size, replace=False))
+    subset = ABSB.select_rows(columns, rows)
+
+    uc_scalar = np.full(rows.size, np.nan)
+    for i in range(rows.size):
+        panel = ABS.Panel(**{name: (v[i] if v.ndim > 0 else v).item() for name, v in subset.items()})
+        try:
+            uc_scalar[i] = panel.UC_buckling_state_limit()
+        except (TypeError, UnboundLocalError, ZeroDivisionError):
+            pass
+
+    uc_float32 = ABSB.evaluate_panels(**subset, dtype=np.float32)["UC_buckling_state_limit"].astype(np.float64)
+    mixed, recompute = evaluate_panels_mixed_precision(subset, uc_atol, boundary_rtol)
+    uc_mixed = mixed["UC_buckling_state_limit"].astype(np.float64)
+
+    compared = np.isfinite(uc_scalar) & (uc_scalar != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error_float32 = np.where(compared, np.nan_to_num(np.abs(uc_float32 - uc_scalar) / np.abs(uc_scalar), nan=np.inf), 0.0)
+        error_mixed = np.where(compared, np.nan_to_num(np.abs(uc_mixed - uc_scalar) / np.abs(uc_scalar), nan=np.inf), 0.0)
+    worst = int(np.argmax(error_float32)) if rows.size else 0
+    return dict(
+        max_rel_error_UC_float32=float(error_float32.max(initial=0.0)),
+        max_rel_error_UC_mixed=float(error_mixed.max(initial=0.0)),
+        worst_row=int(rows[worst]) if rows.size else None,
+        n_compared=int(compared.sum()),
+        n_flagged=int(recompute.sum()),
+    )
@@ -0,0 +1,128 @@
+import numpy as np
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+
+stress_history_columns = ("sigma_ax","sigma_ay","sigma_bx","sigma_by","tau")
+
+
+def open_time_history(path: str, n_panels: int, dtype = np.float32) -> np.memmap:
+    """memory maps a raw binary stress time history without reading it into memory
+
+    Args:
+        path (str): binary file of "dtype" values stored time step by time step, n_panels values per step
+        n_panels (int): number of panels per time step
+        dtype (optional): data type of the stored values. Defaults to np.float32.
+
+    Returns:
+        np.memmap: read-only array of shape (n_steps, n_panels)
+    """
+    return np.memmap(path, dtype=dtype, mode="r").reshape(-1, n_panels)
+
+
+def precompute_panel_geometry(load_case_type, stiffener_type, s, l, t, sigma_0 = 235000, E = 2.06e7, nu = 0.3) -> dict:
+    """calculates the stress independent part of the buckling chain once per panel
+
+    Args:
+        load_case_type (array_like of str): items from the list "valid_load_case_types"
+        stiffener_type (array_like of str): items from the list "valid_stiffener_types"
+        s (array_like): length of shorter side of the plate panel (cm)
+        l (array_like): length of longer side of the plate panel (cm)
+        t (array_like): thickness of plating (cm)
+        sigma_0 (array_like, optional): yield stress of panel material (N/cm^2). Defaults to 235000.
+        E (array_like, optional): modulus of elasticity (N/cm^2). Defaults to 2.06e7.
+        nu (array_like, optional): poisson's ratio. Defaults to 0.3 for steel.
+
+    Returns:
+        dict: per panel arrays of alpha, C1, C2, eta, sigma_0, tau_C and the plate factor
+              (elastic buckling stress per unit boundary dependent constant)
+    """
+    s, l, t, sigma_0, E, nu = (np.asarray(x, dtype=np.float64) for x in (s, l, t, sigma_0, E, nu))
+    alpha = ABS.calc_alpha(l, s)
+    C1 = ABSB.calc_C1(stiffener_type)
+    plate_factor = ABS.calc_stress_E(1.0, t, s, E, nu)
+    tau_C = ABSB.calc_stress_C(ABS.calc_tau_0(sigma_0), ABS.calc_k_s_tau(alpha, C1) * plate_factor)
+    geometry = dict(
+        alpha=alpha,
+        C1=C1,
+        C2=ABSB.calc_C2(stiffener_type),
+        eta=ABSB.calc_eta(load_case_type),
+        sigma_0=sigma_0,
+        tau_C=tau_C,
+        plate_factor=plate_factor,
+    )
+    n_panels = np.broadcast_shapes(*(np.shape(v) for v in geometry.values()))
+    return {name: np.broadcast_to(value, n_panels) for name, value in geometry.items()}
+
+
+def calc_UC_time_steps(geometry: dict, sigma_ax, sigma_ay, sigma_bx, sigma_by, tau) -> np.ndarray:
+    """calculates the buckling state limit UC of a block of time steps against precomputed panel geometry
+
+    Args:
+        geometry (dict): output of "precompute_panel_geometry"
+        sigma_ax, sigma_ay, sigma_bx, sigma_by, tau (np.ndarray): stresses of shape (n_steps, n_panels), N/cm2
+
+    Returns:
+        np.ndarray: UC of shape (n_steps, n_panels), NaN where the chain is undefined (e.g. kappa outside [-1, 1])
+    """
+    sigma_x_max = ABS.calc_sigma_max(sigma_ax, sigma_bx)
+    sigma_y_max = ABS.calc_sigma_max(sigma_ay, sigma_by)
+    kappa_x = ABSB.calc_kappa(ABS.calc_sigma_min(sigma_ax, sigma_bx), sigma_x_max)
+    kappa_y = ABSB.calc_kappa(ABS.calc_sigma_min(sigma_ay, sigma_by), sigma_y_max)
+    sigma_C_x = ABSB.calc_stress_C(geometry["sigma_0"], ABSB.calc_k_s_sigma_x(geometry["C1"], kappa_x) * geometry["plate_factor"])
+    sigma_C_y = ABSB.calc_stress_C(geometry["sigma_0"], ABSB.calc_k_s_sigma_y(geometry["C2"], geometry["alpha"], kappa_y) * geometry["plate_factor"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ABS.calc_UC_buckling_state_limit(sigma_x_max, sigma_y_max, tau, sigma_C_x, sigma_C_y, geometry["tau_C"], geometry["eta"])
+
+
+def stream_peak_UC(geometry: dict, histories: dict, dt: float = 1.0, chunk_steps: int = 10_000, UC_threshold: float = 1.0) -> dict:
+    """reduces stress time histories to the peak UC per panel, reading them chunk by chunk
+
+    Only one chunk of time steps is held in memory at a time, so "histories" can be memory mapped
+    files (see "open_time_history") far larger than memory. Time steps where the chain is undefined
+    are counted in "invalid_steps" and skipped.
+
+    Args:
+        geometry (dict): output of "precompute_panel_geometry"
+        histories (dict): arrays of shape (n_steps, n_panels) for every name in "stress_history_columns", N/cm2
+        dt (float, optional): time step size. Defaults to 1.0.
+        chunk_steps (int, optional): number of time steps evaluated per chunk. Defaults to 10_000.
+        UC_threshold (float, optional): UC above which a time step counts as exceedance. Defaults to 1.0.
+
+    Returns:
+        dict: per panel arrays of "peak_UC", "step_of_peak", "time_of_peak", "exceedance_steps",
+              "exceedance_duration" and "invalid_steps"
+    """
+    missing = set(stress_history_columns) - set(histories)
+    if missing:
+        raise ValueError(f"Missing stress histories {sorted(missing)}. Required histories are: {stress_history_columns}")
+    n_steps, n_panels = np.shape(histories["sigma_ax"])
+
+    peak_UC = np.full(n_panels, -np.inf)
+    step_of_peak = np.full(n_panels, -1)
+    exceedance_steps = np.zeros(n_panels, dtype=np.int64)
+    invalid_steps = np.zeros(n_panels, dtype=np.int64)
+    for start in range(0, n_steps, chunk_steps):
+        steps = slice(start, min(start + chunk_steps, n_steps))
+        chunk = {name: np.asarray(histories[name][steps], dtype=np.float64) for name in stress_history_columns}
+        UC = calc_UC_time_steps(geometry, **chunk)
+
+        invalid = np.isnan(UC)
+        invalid_steps += invalid.sum(axis=0)
+        UC = np.where(invalid, -np.inf, UC)
+        exceedance_steps += (UC > UC_threshold).sum(axis=0)
+
+        chunk_peak_step = UC.argmax(axis=0)
+        chunk_peak = UC[chunk_peak_step, np.arange(n_panels)]
+        is_new_peak = chunk_peak > peak_UC
+        peak_UC[is_new_peak] = chunk_peak[is_new_peak]
+        step_of_peak[is_new_peak] = start + chunk_peak_step[is_new_peak]
+
+    peak_UC[step_of_peak < 0] = np.nan
+    return dict(
+        peak_UC=peak_UC,
+        step_of_peak=step_of_peak,
+        time_of_peak=np.where(step_of_peak < 0, np.nan, step_of_peak * dt),
+        exceedance_steps=exceedance_steps,
+        exceedance_duration=exceedance_steps * dt,
+        invalid_steps=invalid_steps,
+    )
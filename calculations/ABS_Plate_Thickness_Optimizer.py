@@ -0,0 +1,80 @@
+from time import perf_counter
+import numpy as np
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+
+steel_density = 7.85e-3 # density of steel (kg/cm^3)
+
+
+def optimize_thickness(panel_id, columns: dict, catalogue, UC_limit: float = 1.0, density: float = steel_density) -> dict:
+    """sizes the plate thickness of every panel to the lightest catalogue thickness passing all of its load cases
+
+    Each row of "columns" is one load case of one panel, identified by "panel_id". Every catalogue
+    thickness is evaluated for all rows at once with "evaluate_panels", the UC is enveloped per panel
+    and the thinnest thickness whose envelope stays within "UC_limit" is picked. Panels are sized
+    independently with their stresses held fixed, so the thinnest passing plate of each panel also
+    gives the minimum total weight. All rows of a panel must share its plate dimensions "s" and "l".
+
+    Args:
+        panel_id (array_like): panel identifier of each load case row
+        columns (dict): panel input columns, keyed by the names in "panel_input_columns", without "t"
+        catalogue (array_like): available plate thicknesses (cm)
+        UC_limit (float, optional): maximum allowed buckling state limit UC. Defaults to 1.0.
+        density (float, optional): density of plate material (kg/cm^3). Defaults to steel_density.
+
+    Returns:
+        dict: "panel_id", "t" (NaN where no catalogue thickness passes), "UC" (governing UC at "t",
+              or at the thickest plate when none passes), "governing_row", "feasible", "weight" (kg per panel),
+              "total_weight" (kg, NaN when any panel is infeasible), "n_infeasible" and "runtime" (s)
+    """
+    start = perf_counter()
+    if "t" in columns:
+        raise ValueError("columns must not contain the plate thickness 't', it is taken from the catalogue")
+    catalogue = np.unique(np.asarray(catalogue, dtype=np.float64))
+    panel_ids, first_row, row_panel = np.unique(np.asarray(panel_id), return_index=True, return_inverse=True)
+    n_panels = panel_ids.size
+    n_rows = row_panel.size
+
+    s = np.broadcast_to(np.asarray(columns["s"], dtype=np.float64), (n_rows,))
+    l = np.broadcast_to(np.asarray(columns["l"], dtype=np.float64), (n_rows,))
+    mismatched = (s != s[first_row][row_panel]) | (l != l[first_row][row_panel])
+    if mismatched.any():
+        raise ValueError(f"Load case rows of a panel must share its plate dimensions s and l. Mismatched panels: {np.unique(panel_ids[row_panel[mismatched]]).tolist()}")
+
+    t = np.full(n_panels, np.nan)
+    UC = np.full(n_panels, np.nan)
+    governing_row = np.full(n_panels, -1)
+    feasible = np.zeros(n_panels, dtype=bool)
+    for thickness in catalogue:
+        pending = ~feasible
+        if not pending.any():
+            break
+        rows = np.flatnonzero(pending[row_panel])
+        subset = ABSB.select_rows(columns, rows)
+        row_UC = ABSB.evaluate_panels(**subset, t=thickness)["UC_buckling_state_limit"]
+        row_UC = np.where(np.isnan(row_UC), np.inf, row_UC)
+
+        envelope = np.full(n_panels, -np.inf)
+        np.maximum.at(envelope, row_panel[rows], row_UC)
+        envelope_row = np.full(n_panels, -1)
+        is_governing = row_UC == envelope[row_panel[rows]]
+        envelope_row[row_panel[rows][is_governing]] = rows[is_governing]
+
+        passed = pending & (envelope <= UC_limit)
+        UC[pending] = envelope[pending]
+        governing_row[pending] = envelope_row[pending]
+        t[passed] = thickness
+        feasible |= passed
+
+    weight = density * s[first_row] * l[first_row] * t
+    n_infeasible = int((~feasible).sum())
+    return dict(
+        panel_id=panel_ids,
+        t=t,
+        UC=UC,
+        governing_row=governing_row,
+        feasible=feasible,
+        weight=weight,
+        total_weight=float(weight.sum()) if n_infeasible == 0 else np.nan,
+        n_infeasible=n_infeasible,
+        runtime=perf_counter() - start,
+    )
@@ -0,0 +1,24 @@
+import calculations.ABS_Plate_Buckling as ABS
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def make_panel_columns():
+    """factory of random panel input columns, make_panel_columns(n_rows, seed=0, dtype=np.float64)"""
+    def make(n_rows, seed=0, dtype=np.float64):
+        rng = np.random.default_rng(seed)
+        return dict(
+            load_case_type = rng.choice(ABS.valid_load_case_types, n_rows),
+            stiffener_type = rng.choice(ABS.valid_stiffener_types, n_rows),
+            s = rng.uniform(50, 90, n_rows).astype(dtype),
+            l = rng.uniform(100, 400, n_rows).astype(dtype),
+            t = rng.uniform(0.8, 2.0, n_rows).astype(dtype),
+            sigma_ax = rng.uniform(1000, 10000, n_rows).astype(dtype),
+            sigma_ay = rng.uniform(1000, 5000, n_rows).astype(dtype),
+            sigma_bx = rng.uniform(0, 1000, n_rows).astype(dtype),
+            sigma_by = rng.uniform(0, 1000, n_rows).astype(dtype),
+            tau = rng.uniform(0, 5000, n_rows).astype(dtype),
+            sigma_0 = 23500
+        )
+    return make
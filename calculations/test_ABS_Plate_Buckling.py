@@ -1,5 +1,9 @@
 import  calculations.ABS_Plate_Buckling as ABS
+import json
 import math
+import os
+import subprocess
+import sys
 
 def test_calc_alpha():
     assert math.isclose(ABS.calc_alpha(60,60), 1.0)
@@ -181,3 +185,24 @@ def test_Panel_UC_buckling_state_limit():
 
     
 
+    
+def modules_loaded_by(statement):
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import json, sys; print(json.dumps(sorted(sys.modules)))"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return {name.split(".")[0] for name in json.loads(completed.stdout)}
+
+def test_core_import_is_standard_library_only():
+    # modules a bare interpreter already loads (e.g. site-packages .pth hooks) are not imported by the core
+    startup = modules_loaded_by("pass")
+    assert modules_loaded_by("import calculations.ABS_Plate_Buckling") - startup - set(sys.stdlib_module_names) - {"calculations", "__main__"} == set()
+
+def test_bulk_import_does_not_load_handcalcs():
+    assert "handcalcs" not in modules_loaded_by("import calculations.ABS_Plate_Buckling_Bulk")
+
+def test_app_module_imports_handcalcs_lazily():
+    assert "handcalcs" not in modules_loaded_by("import app_module")
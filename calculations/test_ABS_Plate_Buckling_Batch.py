@@ -0,0 +1,74 @@
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+import calculations.ABS_Plate_Buckling_Batch as ABSBatch
+import numpy as np
+import os
+import pytest
+
+
+def test_evaluate_panels_checkpointed_matches_single_pass(tmp_path, make_panel_columns):
+    columns = make_panel_columns(1000)
+    expected = ABSB.evaluate_panels(**columns)
+    results = ABSBatch.evaluate_panels_checkpointed(columns, tmp_path / "ckpt", chunk_size=128)
+    for name in ABSB.panel_result_columns:
+        assert np.array_equal(results[name], expected[name], equal_nan=True)
+    assert os.listdir(tmp_path / "ckpt") == []
+
+
+def test_evaluate_panels_checkpointed_resume(tmp_path, monkeypatch, make_panel_columns):
+    columns = make_panel_columns(1000)
+    expected = ABSB.evaluate_panels(**columns)
+    checkpoint_dir = tmp_path / "ckpt"
+
+    calls = []
+    evaluate_panels = ABSB.evaluate_panels
+    def crash_after_three_chunks(**chunk_columns):
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        calls.append(1)
+        return evaluate_panels(**chunk_columns)
+    monkeypatch.setattr(ABSB, "evaluate_panels", crash_after_three_chunks)
+    with pytest.raises(KeyboardInterrupt):
+        ABSBatch.evaluate_panels_checkpointed(columns, checkpoint_dir, chunk_size=128)
+    assert sorted(os.listdir(checkpoint_dir)) == ["chunk_00000000.npz", "chunk_00000001.npz", "chunk_00000002.npz", "manifest.json"]
+
+    calls.clear()
+    monkeypatch.setattr(ABSB, "evaluate_panels", lambda **chunk_columns: calls.append(1) or evaluate_panels(**chunk_columns))
+    results = ABSBatch.evaluate_panels_checkpointed(columns, checkpoint_dir, chunk_size=128)
+    assert len(calls) == 5
+    for name in ABSB.panel_result_columns:
+        assert np.array_equal(results[name], expected[name], equal_nan=True)
+
+
+def test_evaluate_panels_checkpointed_rejects_changed_inputs(tmp_path, make_panel_columns):
+    columns = make_panel_columns(300)
+    ABSBatch.evaluate_panels_checkpointed(columns, tmp_path, chunk_size=100, keep_checkpoint=True)
+    columns["t"] = columns["t"] * 1.1
+    with pytest.raises(ValueError):
+        ABSBatch.evaluate_panels_checkpointed(columns, tmp_path, chunk_size=100)
+
+
+def test_evaluate_panels_checkpointed_float32(tmp_path, make_panel_columns):
+    columns = make_panel_columns(300)
+    results = ABSBatch.evaluate_panels_checkpointed(columns, tmp_path, chunk_size=100, dtype=np.float32)
+    expected = ABSB.evaluate_panels(**columns, dtype=np.float32)
+    assert results["UC_buckling_state_limit"].dtype == np.float32
+    assert np.array_equal(results["UC_buckling_state_limit"], expected["UC_buckling_state_limit"], equal_nan=True)
+
+
+def test_evaluate_panels_checkpointed_resume_object_strings(tmp_path, make_panel_columns):
+    string_columns = ("load_case_type", "stiffener_type")
+    columns = make_panel_columns(300)
+    for name in string_columns:
+        columns[name] = columns[name].astype(object)
+    ABSBatch.evaluate_panels_checkpointed(columns, tmp_path, chunk_size=100, keep_checkpoint=True)
+    os.remove(tmp_path / "chunk_00000002.npz")
+
+    # a resumed process holds equal strings at different addresses
+    resumed = dict(columns)
+    for name in string_columns:
+        resumed[name] = np.array(["".join(x) for x in columns[name]], dtype=object)
+    assert ABSBatch.fingerprint_columns(resumed) == ABSBatch.fingerprint_columns(columns)
+    results = ABSBatch.evaluate_panels_checkpointed(resumed, tmp_path, chunk_size=100)
+    expected = ABSB.evaluate_panels(**columns)
+    for name in ABSB.panel_result_columns:
+        assert np.array_equal(results[name], expected[name], equal_nan=True)
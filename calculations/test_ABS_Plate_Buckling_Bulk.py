@@ -0,0 +1,91 @@
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+import numpy as np
+import math
+import pytest
+
+
+def test_calc_C1():
+    assert np.allclose(ABSB.calc_C1(["ANGLE","TEE","FLAT BAR","PLATE ELEMENT"]), [1.1, 1.1, 1.0, 1.0])
+    with pytest.raises(ValueError):
+        ABSB.calc_C1(["ANGLE","CHANNEL"])
+
+
+def test_calc_C2():
+    assert np.allclose(ABSB.calc_C2(["ANGLE","FLAT BAR","BULB PLATE","WEB PLATE OF STIFFENERS"]), [1.2, 1.1, 1.1, 1.0])
+
+
+def test_calc_eta():
+    assert np.allclose(ABSB.calc_eta(["NORMAL OPERATION","SEVERE STORM"]), [0.6, 0.8])
+    with pytest.raises(ValueError):
+        ABSB.calc_eta(["EXTREME"])
+
+
+def test_calc_kappa():
+    kappa = ABSB.calc_kappa(np.array([8000.0, -10.0, 5.0]), np.array([12000.0, 10.0, 0.0]))
+    assert np.allclose(kappa[:2], [0.6666666667, -1.0])
+    assert np.isnan(kappa[2])
+
+
+def test_calc_k_s_sigma_x():
+    kappa_x = np.array([0, 0.5, 1.0, -0.5, -1.0, 1.5])
+    k = ABSB.calc_k_s_sigma_x(10, kappa_x)
+    assert np.allclose(k[:5], [ABS.calc_k_s_sigma_x(10, kappa) for kappa in kappa_x[:5]])
+    assert np.isnan(k[5])
+
+
+def test_calc_k_s_sigma_y():
+    alpha = np.array([2.5, 2.5, 1.0, 1.5, 2.0, 2.5, 0.5])
+    kappa_y = np.array([1, (1/3), 0.25, 0.25, 0.25, 0.25, 0.25])
+    k = ABSB.calc_k_s_sigma_y(10, alpha, kappa_y)
+    assert np.allclose(k[:6], [ABS.calc_k_s_sigma_y(10, a, kappa) for a, kappa in zip(alpha[:6], kappa_y[:6])])
+    assert np.isnan(k[6])
+
+
+def test_calc_stress_C():
+    assert np.allclose(ABSB.calc_stress_C(10000, np.array([5000, 6000, 7000])), [5000.0, 6000.0, 6571.428571])
+
+
+panel_inputs = dict(
+    load_case_type = ["NORMAL OPERATION", "SEVERE STORM", "NORMAL OPERATION"],
+    stiffener_type = ["ANGLE", "FLAT BAR", "PLATE ELEMENT"],
+    s = [60, 70, 80],
+    l = [120, 100, 400],
+    t = [1.2, 1.0, 1.5],
+    sigma_ax = [10000, 8000, 2000],
+    sigma_ay = [5000, 3000, 1000],
+    sigma_bx = [2000, 9000, 500],
+    sigma_by = [1000, 500, 2000],
+    tau = [5000, 2000, 1e-6],
+    sigma_0 = 23500
+)
+
+
+def test_evaluate_panels_matches_Panel():
+    results = ABSB.evaluate_panels(**panel_inputs)
+    assert set(results) == set(ABSB.panel_result_columns)
+    for i in range(3):
+        panel = ABS.Panel(**{name: (v[i] if isinstance(v, list) else v) for name, v in panel_inputs.items()})
+        for name in ABSB.panel_result_columns:
+            assert math.isclose(results[name][i], getattr(panel, name)())
+
+
+def test_evaluate_panels_scalar_broadcast():
+    results = ABSB.evaluate_panels("NORMAL OPERATION", "ANGLE", 60, [120, 180], 1.2, 10000, 5000, 2000, 1000, 5000, sigma_0=23500)
+    assert results["UC_buckling_state_limit"].shape == (2,)
+    assert math.isclose(results["UC_buckling_state_limit"][0], 1.822777016)
+
+
+def test_evaluate_UC_grid():
+    panel = ABS.Panel("NORMAL OPERATION", "ANGLE", 60, 120, 1.2, 10000, 5000, 2000, 1000, 5000, sigma_0=23500)
+    sigma_x_max, sigma_y_max = np.meshgrid(np.linspace(0, 20000, 5), np.linspace(0, 10000, 3))
+    UC = ABSB.evaluate_UC_grid(panel, sigma_x_max=sigma_x_max, sigma_y_max=sigma_y_max)
+    assert UC.shape == (3, 5)
+    assert math.isclose(ABSB.evaluate_UC_grid(panel, sigma_x_max=[12000])[0], 1.822777016)
+    assert math.isclose(UC[1, 2], ABS.calc_UC_buckling_state_limit(10000, 5000, 5000, panel.sigma_C_x(), panel.sigma_C_y(), panel.tau_C(), panel.eta()))
+
+
+def test_select_rows():
+    selected = ABSB.select_rows(dict(s=[60, 70, 80], stiffener_type="ANGLE", sigma_0=23500), [0, 2])
+    assert list(selected["s"]) == [60, 80]
+    assert selected["stiffener_type"] == "ANGLE" and selected["sigma_0"] == 23500
@@ -0,0 +1,81 @@
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+import calculations.ABS_Plate_Buckling_IO as ABSIO
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+panel_table = pa.table(dict(
+    element_id = [101, 102, 103, 104],
+    load_case_type = ["NORMAL OPERATION", "SEVERE STORM", "NORMAL OPERATION", "SEVERE STORM"],
+    stiffener_type = pa.array(["ANGLE", "FLAT BAR", "PLATE ELEMENT", "ANGLE"]).dictionary_encode(),
+    s = [60.0, 70.0, 80.0, 60.0],
+    l = [120.0, 100.0, 400.0, 180.0],
+    t = [1.2, 1.0, 1.5, 1.2],
+    sigma_ax = [10000.0, 8000.0, 2000.0, 6000.0],
+    sigma_ay = [5000.0, 3000.0, 1000.0, 2000.0],
+    sigma_bx = [2000.0, 9000.0, 500.0, 0.0],
+    sigma_by = [1000.0, 500.0, 2000.0, 0.0],
+    shear = [5000.0, 2000.0, 1e-6, 100.0],
+    sigma_0 = [23500.0, 23500.0, 23500.0, 35500.0],
+))
+
+
+def test_table_to_panel_columns():
+    columns = ABSIO.table_to_panel_columns(panel_table, column_map=dict(tau="shear"))
+    assert set(columns) == set(ABSB.panel_input_columns) - {"E", "nu"}
+    assert list(columns["stiffener_type"]) == ["ANGLE", "FLAT BAR", "PLATE ELEMENT", "ANGLE"]
+    assert columns["s"].dtype == np.float64
+    with pytest.raises(ValueError):
+        ABSIO.table_to_panel_columns(panel_table)
+
+
+def test_evaluate_parquet(tmp_path):
+    pq.write_table(panel_table, tmp_path / "panels.parquet", row_group_size=2)
+    n_rows = ABSIO.evaluate_parquet(tmp_path / "panels.parquet", tmp_path / "results.parquet", column_map=dict(tau="shear"), passthrough_columns=["element_id"], batch_size=3)
+    assert n_rows == 4
+    written = pq.read_table(tmp_path / "results.parquet")
+    assert written.schema.names == ["element_id"] + ABSIO.required_file_columns(dict(tau="shear"), panel_table.schema.names) + list(ABSB.panel_result_columns)
+    assert written.column("element_id").to_pylist() == [101, 102, 103, 104]
+    expected = ABSB.evaluate_panels(**ABSIO.table_to_panel_columns(panel_table, column_map=dict(tau="shear")))
+    for name in ABSB.panel_result_columns:
+        assert np.array_equal(written.column(name).to_numpy(), expected[name], equal_nan=True)
+
+
+def test_evaluate_parquet_results_only(tmp_path):
+    pq.write_table(panel_table, tmp_path / "panels.parquet")
+    ABSIO.evaluate_parquet(tmp_path / "panels.parquet", tmp_path / "results.parquet", column_map=dict(tau="shear"), keep_inputs=False, dtype=np.float32)
+    written = pq.read_table(tmp_path / "results.parquet")
+    assert written.schema.names == list(ABSB.panel_result_columns)
+    assert written.schema.field("UC_buckling_state_limit").type == pa.float32()
+
+
+def test_evaluate_parquet_reads_only_needed_columns(tmp_path, monkeypatch):
+    pq.write_table(panel_table.append_column("unused", pa.array(["x"] * 4)), tmp_path / "panels.parquet")
+    read_columns = []
+    iter_batches = pq.ParquetFile.iter_batches
+    def record_columns(self, *args, columns=None, **kwargs):
+        read_columns.append(columns)
+        return iter_batches(self, *args, columns=columns, **kwargs)
+    monkeypatch.setattr(pq.ParquetFile, "iter_batches", record_columns)
+    ABSIO.evaluate_parquet(tmp_path / "panels.parquet", tmp_path / "results.parquet", column_map=dict(tau="shear"))
+    assert read_columns[0] is not None and "unused" not in read_columns[0] and "element_id" not in read_columns[0]
+
+
+def test_evaluate_parquet_empty_source(tmp_path):
+    pq.write_table(panel_table.slice(0, 0), tmp_path / "panels.parquet")
+    n_rows = ABSIO.evaluate_parquet(tmp_path / "panels.parquet", tmp_path / "results.parquet", column_map=dict(tau="shear"), passthrough_columns=["element_id"])
+    assert n_rows == 0
+    written = pq.read_table(tmp_path / "results.parquet")
+    assert written.num_rows == 0
+    assert written.schema.names[0] == "element_id" and written.schema.names[-1] == "UC_buckling_state_limit"
+
+
+def test_table_to_panel_columns_zero_copy():
+    assert panel_table.column("s").num_chunks == 1
+    columns = ABSIO.table_to_panel_columns(panel_table, column_map=dict(tau="shear"))
+    source = panel_table.column("s").chunk(0).to_numpy()
+    assert np.shares_memory(columns["s"], source)
+    chunked = pa.concat_tables([panel_table, panel_table])
+    assert chunked.column("s").num_chunks == 2
+    assert list(ABSIO.table_to_panel_columns(chunked, column_map=dict(tau="shear"))["s"]) == [60.0, 70.0, 80.0, 60.0] * 2
@@ -0,0 +1,85 @@
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Bulk as ABSB
+import calculations.ABS_Plate_Buckling_Precision as ABSP
+import numpy as np
+
+
+def test_evaluate_panels_float32_dtype(make_panel_columns):
+    results = ABSB.evaluate_panels(**make_panel_columns(10, seed=1, dtype=np.float32), dtype=np.float32)
+    assert all(results[name].dtype == np.float32 for name in ABSB.panel_result_columns)
+
+
+def test_flag_float64_recompute():
+    results = ABSB.evaluate_panels(
+        load_case_type = "NORMAL OPERATION",
+        stiffener_type = "PLATE ELEMENT",
+        s = 60,
+        l = [120, 150, 150, 150],
+        t = 1.2,
+        sigma_ax = [5000, 5000, 5000, 5000],
+        sigma_ay = [1000, 1000, 2000, 1000],
+        sigma_bx = [0, 0, 0, 0],
+        sigma_by = [0, 0, 1000, 0],
+        tau = [1e-6, 1e-6, 1e-6, 1e-6],
+        sigma_0 = 23500,
+        dtype = np.float32
+    )
+    results["UC_buckling_state_limit"][3] = 1.0002
+    assert list(ABSP.flag_float64_recompute(results, 23500, sigma_ax=5000, sigma_bx=[0, 0, 0, 0])) == [True, False, True, True]
+
+
+def test_evaluate_panels_mixed_precision(make_panel_columns):
+    columns = make_panel_columns(2000, seed=1, dtype=np.float32)
+    results, recompute = ABSP.evaluate_panels_mixed_precision(columns)
+    results64 = ABSB.evaluate_panels(**columns)
+    assert results["UC_buckling_state_limit"].dtype == np.float32
+    assert np.array_equal(results["UC_buckling_state_limit"][recompute], ABSP.round_UC_float32(results64["UC_buckling_state_limit"][recompute]))
+
+
+def test_validate_reduced_precision(make_panel_columns):
+    report = ABSP.validate_reduced_precision(make_panel_columns(3000, seed=1, dtype=np.float32), sample_size=500)
+    assert report["n_compared"] == 500
+    assert report["max_rel_error_UC_float32"] < 1e-5
+    assert report["max_rel_error_UC_mixed"] <= report["max_rel_error_UC_float32"] + 1e-7
+
+
+def test_round_UC_float32():
+    ulp = np.spacing(np.float32(1.0))
+    UC = ABSP.round_UC_float32(np.array([1.0 + float(ulp) / 4, 1.0, 1.0 - 1e-9, 0.5, 2.0]))
+    assert UC.dtype == np.float32
+    assert list(UC <= 1.0) == [False, True, True, True, False]
+
+
+def test_evaluate_panels_mixed_precision_keeps_UC_check_at_limit():
+    panel = ABS.Panel("NORMAL OPERATION", "ANGLE", 60, 120, 1.2, 3000, 2000, 500, 500, 0.0, sigma_0=23500)
+    UC_without_shear = panel.UC_buckling_state_limit()
+    tau = panel.eta() * panel.tau_C() * np.sqrt(1.0 + 3e-8 - UC_without_shear)
+    columns = dict(load_case_type="NORMAL OPERATION", stiffener_type="ANGLE", s=[60.0], l=[120.0], t=[1.2],
+                   sigma_ax=[3000.0], sigma_ay=[2000.0], sigma_bx=[500.0], sigma_by=[500.0], tau=[tau], sigma_0=23500)
+    UC64 = ABSB.evaluate_panels(**columns)["UC_buckling_state_limit"][0]
+    assert 1.0 < UC64 < 1.0 + float(np.spacing(np.float32(1.0))) / 2
+    results, recompute = ABSP.evaluate_panels_mixed_precision(columns)
+    assert recompute[0]
+    assert results["UC_buckling_state_limit"][0] > 1.0
+
+
+def test_flag_float64_recompute_kappa_x_edge():
+    columns = dict(load_case_type="NORMAL OPERATION", stiffener_type="ANGLE", s=60, l=150, t=1.2,
+                   sigma_ax=5000, sigma_ay=1000, sigma_bx=[-1e-5, 2500.0], sigma_by=0, tau=1e-6, sigma_0=23500)
+    assert np.isnan(ABSB.evaluate_panels(**columns)["UC_buckling_state_limit"][0])
+    results32 = ABSB.evaluate_panels(**columns, dtype=np.float32)
+    assert list(ABSP.flag_float64_recompute(results32, 23500, sigma_ax=5000, sigma_bx=[-1e-5, 2500.0])) == [True, False]
+    assert ABSP.flag_float64_recompute(results32, 23500)[0]
+    results, _ = ABSP.evaluate_panels_mixed_precision(columns)
+    assert np.isnan(results["UC_buckling_state_limit"][0])
+
+
+def test_mixed_precision_single_scalar_panel():
+    columns = dict(load_case_type="NORMAL OPERATION", stiffener_type="ANGLE", s=60, l=120, t=1.2,
+                   sigma_ax=10000, sigma_ay=5000, sigma_bx=2000, sigma_by=1000, tau=5000, sigma_0=23500)
+    results, recompute = ABSP.evaluate_panels_mixed_precision(columns)
+    assert results["UC_buckling_state_limit"].shape == (1,) and recompute.shape == (1,)
+    assert recompute[0] # alpha = 2 is a branch boundary
+    assert np.isclose(results["UC_buckling_state_limit"][0], 1.822777016)
+    report = ABSP.validate_reduced_precision(columns)
+    assert report["n_compared"] == 1 and report["max_rel_error_UC_mixed"] < 1e-6
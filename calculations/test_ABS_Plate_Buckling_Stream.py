@@ -0,0 +1,61 @@
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Buckling_Stream as ABSS
+import numpy as np
+import math
+
+panels = dict(
+    load_case_type = ["NORMAL OPERATION", "SEVERE STORM", "NORMAL OPERATION"],
+    stiffener_type = ["ANGLE", "FLAT BAR", "PLATE ELEMENT"],
+    s = [60, 70, 80],
+    l = [120, 100, 400],
+    t = [1.2, 1.0, 1.5],
+    sigma_0 = 23500
+)
+
+
+def make_histories(n_steps):
+    rng = np.random.default_rng(2)
+    phase = np.linspace(0, 20 * np.pi, n_steps)[:, np.newaxis]
+    return dict(
+        sigma_ax = (6000 + 4000 * np.sin(phase + rng.uniform(0, 1, 3))).astype(np.float32),
+        sigma_ay = (3000 + 1000 * np.cos(phase)).astype(np.float32) * np.ones(3, dtype=np.float32),
+        sigma_bx = rng.uniform(0, 1000, (n_steps, 3)).astype(np.float32),
+        sigma_by = rng.uniform(0, 1000, (n_steps, 3)).astype(np.float32),
+        tau = rng.uniform(0, 4000, (n_steps, 3)).astype(np.float32),
+    )
+
+
+def scalar_UCs(histories, n_steps):
+    UCs = np.empty((n_steps, 3))
+    for step in range(n_steps):
+        for i in range(3):
+            UCs[step, i] = ABS.Panel(
+                **{name: (v[i] if isinstance(v, list) else v) for name, v in panels.items()},
+                **{name: float(histories[name][step, i]) for name in ABSS.stress_history_columns}
+            ).UC_buckling_state_limit()
+    return UCs
+
+
+def test_calc_UC_time_steps_matches_Panel():
+    histories = make_histories(50)
+    geometry = ABSS.precompute_panel_geometry(**panels)
+    UC = ABSS.calc_UC_time_steps(geometry, **{name: v.astype(np.float64) for name, v in histories.items()})
+    assert np.allclose(UC, scalar_UCs(histories, 50), rtol=1e-12)
+
+
+def test_stream_peak_UC(tmp_path):
+    n_steps = 400
+    histories = make_histories(n_steps)
+    expected = scalar_UCs(histories, n_steps)
+    mapped = {}
+    for name, values in histories.items():
+        values.tofile(tmp_path / f"{name}.bin")
+        mapped[name] = ABSS.open_time_history(tmp_path / f"{name}.bin", n_panels=3)
+
+    result = ABSS.stream_peak_UC(ABSS.precompute_panel_geometry(**panels), mapped, dt=0.1, chunk_steps=64)
+    assert np.allclose(result["peak_UC"], expected.max(axis=0), rtol=1e-12)
+    assert list(result["step_of_peak"]) == list(expected.argmax(axis=0))
+    assert np.allclose(result["time_of_peak"], expected.argmax(axis=0) * 0.1)
+    assert list(result["exceedance_steps"]) == list((expected > 1.0).sum(axis=0))
+    assert math.isclose(result["exceedance_duration"][0], result["exceedance_steps"][0] * 0.1)
+    assert list(result["invalid_steps"]) == [0, 0, 0]
@@ -0,0 +1,67 @@
+import calculations.ABS_Plate_Buckling as ABS
+import calculations.ABS_Plate_Thickness_Optimizer as ABSO
+import numpy as np
+import math
+import pytest
+
+catalogue = [0.8, 1.0, 1.2, 1.5, 2.0, 2.5]
+
+panel_id = ["P1", "P1", "P2", "P2", "P3"]
+columns = dict(
+    load_case_type = ["NORMAL OPERATION", "SEVERE STORM", "NORMAL OPERATION", "SEVERE STORM", "NORMAL OPERATION"],
+    stiffener_type = ["ANGLE", "ANGLE", "FLAT BAR", "FLAT BAR", "PLATE ELEMENT"],
+    s = [60, 60, 80, 80, 60],
+    l = [120, 120, 240, 240, 120],
+    sigma_ax = [6000, 8000, 3000, 5000, 30000],
+    sigma_ay = [5000, 4000, 1000, 2000, 20000],
+    sigma_bx = [2000, 1000, 500, 500, 0],
+    sigma_by = [1000, 1000, 500, 500, 0],
+    tau = [5000, 3000, 1000, 2000, 10000],
+    sigma_0 = 23500
+)
+
+
+def brute_force_thickness(rows):
+    for thickness in catalogue:
+        UCs = [
+            ABS.Panel(**{name: (v[i] if isinstance(v, list) else v) for name, v in columns.items()}, t=thickness).UC_buckling_state_limit()
+            for i in rows
+        ]
+        if max(UCs) <= 1.0:
+            return thickness
+    return None
+
+
+def test_optimize_thickness_matches_brute_force():
+    result = ABSO.optimize_thickness(panel_id, columns, catalogue)
+    assert list(result["panel_id"]) == ["P1", "P2", "P3"]
+    assert math.isclose(result["t"][0], brute_force_thickness([0, 1]))
+    assert math.isclose(result["t"][1], brute_force_thickness([2, 3]))
+    assert brute_force_thickness([4]) is None
+    assert list(result["feasible"]) == [True, True, False]
+    assert np.isnan(result["t"][2]) and result["UC"][2] > 1.0
+    assert all(result["UC"][:2] <= 1.0)
+    assert result["governing_row"][0] in (0, 1) and result["governing_row"][1] in (2, 3)
+
+
+def test_optimize_thickness_weight():
+    result = ABSO.optimize_thickness(panel_id[:4], {name: v[:4] if isinstance(v, list) else v for name, v in columns.items()}, catalogue)
+    expected = ABSO.steel_density * (60 * 120 * result["t"][0] + 80 * 240 * result["t"][1])
+    assert math.isclose(result["total_weight"], expected)
+    assert result["n_infeasible"] == 0
+
+
+def test_optimize_thickness_total_weight_with_infeasible_panel():
+    result = ABSO.optimize_thickness(panel_id, columns, catalogue)
+    assert result["n_infeasible"] == 1
+    assert math.isnan(result["total_weight"])
+
+
+def test_optimize_thickness_rejects_mismatched_geometry():
+    with pytest.raises(ValueError, match="P2"):
+        ABSO.optimize_thickness(panel_id, dict(columns, l=[120, 120, 240, 250, 120]), catalogue)
+
+
+def test_optimize_thickness_rejects_t_column():
+    with pytest.raises(ValueError):
+        ABSO.optimize_thickness(panel_id, dict(columns, t=1.0), catalogue)